@@ -1,92 +1,159 @@
 """Logic to match certificate experiences against CV entries."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date
 from difflib import SequenceMatcher
-from typing import Iterable, List, Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
 
 from .models import ComparisonResult, ExperienceRecord
 
+# rapidfuzz is an optional accelerator, unlike numpy/scipy: without it employer names
+# are scored with difflib.SequenceMatcher, which gives comparable Indel-style ratios.
+try:
+    from rapidfuzz import fuzz, process  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency, fall back to difflib
+    fuzz = None  # type: ignore
+    process = None  # type: ignore
+
+MATCH_THRESHOLD = 0.3
+EMPLOYER_WEIGHT = 0.7
+DATE_WEIGHT = 0.3
+START_DATE_TOLERANCE_DAYS = 7
+# Day difference assumed when one of the start dates is unknown.
+MISSING_DATE_DIFFERENCE_DAYS = 60
+
 
-@dataclass
-class MatchScore:
-    certificate: ExperienceRecord
-    cv_entry: ExperienceRecord
-    score: float
-    start_date_match: bool
+# Folds accents and drops ASCII punctuation in a single str.translate call.
+_NORMALIZE_TABLE = str.maketrans(
+    "áéíóúñ",
+    "aeioun",
+    "".join(ch for ch in map(chr, range(128)) if not (ch.isalnum() or ch.isspace())),
+)
 
 
+@lru_cache(maxsize=4096)
 def _normalize_name(name: Optional[str]) -> str:
     if not name:
         return ""
-    cleaned = name.lower()
-    replacements = {
-        "á": "a",
-        "é": "e",
-        "í": "i",
-        "ó": "o",
-        "ú": "u",
-        "ñ": "n",
-    }
-    for src, dest in replacements.items():
-        cleaned = cleaned.replace(src, dest)
-    return "".join(ch for ch in cleaned if ch.isalnum() or ch.isspace()).strip()
-
-
-def _employer_similarity(a: Optional[str], b: Optional[str]) -> float:
-    a_norm = _normalize_name(a)
-    b_norm = _normalize_name(b)
-    if not a_norm or not b_norm:
+    cleaned = name.lower().translate(_NORMALIZE_TABLE)
+    if not cleaned.isascii():
+        cleaned = "".join(ch for ch in cleaned if ch.isalnum() or ch.isspace())
+    return cleaned.strip()
+
+
+def _difflib_similarity(matcher: SequenceMatcher, certificate_name: str, required: float) -> float:
+    """Similarity of *certificate_name* against the name set as the matcher's ``seq2``.
+
+    *required* is the similarity the pair has to exceed to clear ``MATCH_THRESHOLD``
+    given its date score; pairs that cannot reach it score 0.
+    """
+
+    cv_name = matcher.b
+    if not certificate_name or not cv_name:
+        return 0.0
+    # Same bound as SequenceMatcher.real_quick_ratio(): skip pairs whose lengths alone
+    # rule out reaching the required similarity.
+    a_len, b_len = len(certificate_name), len(cv_name)
+    if 2 * min(a_len, b_len) / (a_len + b_len) <= required:
         return 0.0
-    return SequenceMatcher(None, a_norm, b_norm).ratio()
-
-
-def _date_difference(a: Optional[date], b: Optional[date]) -> Optional[int]:
-    if a is None or b is None:
-        return None
-    return abs((a - b).days)
-
-
-def _score_pair(certificate: ExperienceRecord, cv_entry: ExperienceRecord) -> MatchScore:
-    similarity = _employer_similarity(certificate.employer, cv_entry.employer)
-    start_diff = _date_difference(certificate.start_date, cv_entry.start_date)
-    start_match = start_diff is not None and start_diff <= 7
-    date_score = 1.0 if start_match else 1.0 / (1 + (start_diff or 60) / 30)
-    combined_score = 0.7 * similarity + 0.3 * date_score
-    return MatchScore(
-        certificate=certificate,
-        cv_entry=cv_entry,
-        score=combined_score,
-        start_date_match=start_match,
+    matcher.set_seq1(certificate_name)
+    return matcher.ratio()
+
+
+def _similarity_matrix(
+    certificate_names: Sequence[str],
+    cv_names: Sequence[str],
+    required: np.ndarray,
+) -> np.ndarray:
+    """Employer similarity for every (certificate, CV entry) pair."""
+
+    if process is not None:
+        similarity = process.cdist(
+            certificate_names, cv_names, scorer=fuzz.ratio, dtype=np.float32, workers=-1
+        ) / 100.0
+        # rapidfuzz scores two empty strings as identical; an unknown employer matches nothing.
+        similarity[[not name for name in certificate_names], :] = 0.0
+        similarity[:, [not name for name in cv_names]] = 0.0
+        return similarity
+
+    similarity = np.zeros((len(certificate_names), len(cv_names)), dtype=np.float32)
+    matcher = SequenceMatcher(autojunk=False)
+    for col, cv_name in enumerate(cv_names):
+        # set_seq2 builds the lookup index of the name, so it is done once per CV entry
+        # and reused for every certificate, as difflib.get_close_matches does.
+        matcher.set_seq2(cv_name)
+        for row, certificate_name in enumerate(certificate_names):
+            similarity[row, col] = _difflib_similarity(matcher, certificate_name, required[row, col])
+    return similarity
+
+
+def _start_ordinals(records: Sequence[ExperienceRecord]) -> Tuple[np.ndarray, np.ndarray]:
+    """Start dates as integer day ordinals plus a mask of which records have one."""
+
+    known = np.array([record.start_date is not None for record in records], dtype=bool)
+    ordinals = np.array(
+        [record.start_date.toordinal() if record.start_date else 0 for record in records],
+        dtype=np.int64,
     )
+    return ordinals, known
 
 
 def compare_certificates_with_cv(
     certificates: Iterable[ExperienceRecord],
     cv_entries: Iterable[ExperienceRecord],
 ) -> List[ComparisonResult]:
+    """Pair each certificate with at most one CV entry.
+
+    Every (certificate, CV entry) pair is scored from employer similarity and start
+    date proximity, and the pairing that maximizes the total score is chosen, so two
+    certificates can never claim the same CV entry.
+    """
+
+    certificate_list = list(certificates)
     cv_list = list(cv_entries)
     comparisons: List[ComparisonResult] = []
-    used_cv_indices: set[int] = set()
-
-    for certificate in certificates:
-        best_score: Optional[MatchScore] = None
-        for idx, cv_entry in enumerate(cv_list):
-            score = _score_pair(certificate, cv_entry)
-            if best_score is None or score.score > best_score.score:
-                best_score = score
-                best_idx = idx
-        if best_score and best_score.score > 0.3:
-            used_cv_indices.add(best_idx)
+    assignment: dict[int, int] = {}
+
+    if certificate_list and cv_list:
+        certificate_names = [_normalize_name(certificate.employer) for certificate in certificate_list]
+        cv_names = [_normalize_name(cv_entry.employer) for cv_entry in cv_list]
+        certificate_ordinals, certificate_known = _start_ordinals(certificate_list)
+        cv_ordinals, cv_known = _start_ordinals(cv_list)
+
+        both_known = certificate_known[:, None] & cv_known[None, :]
+        start_diff = np.where(
+            both_known,
+            np.abs(certificate_ordinals[:, None] - cv_ordinals[None, :]),
+            MISSING_DATE_DIFFERENCE_DAYS,
+        )
+        start_matches = both_known & (start_diff <= START_DATE_TOLERANCE_DAYS)
+        date_score = np.where(start_matches, 1.0, 1.0 / (1 + start_diff / 30))
+        required = (MATCH_THRESHOLD - DATE_WEIGHT * date_score) / EMPLOYER_WEIGHT
+        similarity = _similarity_matrix(certificate_names, cv_names, required)
+        scores = EMPLOYER_WEIGHT * similarity + DATE_WEIGHT * date_score
+        # Pairs below the threshold are never reported, so they must not steer the assignment.
+        scores[scores <= MATCH_THRESHOLD] = 0.0
+
+        rows, cols = linear_sum_assignment(scores, maximize=True)
+        assignment = {
+            int(row): int(col) for row, col in zip(rows, cols) if scores[row, col] > MATCH_THRESHOLD
+        }
+
+    for row, certificate in enumerate(certificate_list):
+        col = assignment.get(row)
+        if col is not None:
+            start_match = bool(start_matches[row, col])
             comparisons.append(
                 ComparisonResult(
                     certificate=certificate,
-                    cv_entry=cv_list[best_idx],
-                    start_date_match=best_score.start_date_match,
+                    cv_entry=cv_list[col],
+                    start_date_match=start_match,
                     details=(
                         "Coincidencia por empleador y fecha"
-                        if best_score.start_date_match
+                        if start_match
                         else "Coincidencia parcial"
                     ),
                 )
@@ -102,8 +169,11 @@ def compare_certificates_with_cv(
             )
 
     # Add unmatched CV entries as informational rows
+    used_cv_entries = bytearray(len(cv_list))
+    for col in assignment.values():
+        used_cv_entries[col] = 1
     for idx, cv_entry in enumerate(cv_list):
-        if idx not in used_cv_indices:
+        if not used_cv_entries[idx]:
             comparisons.append(
                 ComparisonResult(
                     certificate=ExperienceRecord(
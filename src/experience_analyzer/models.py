@@ -30,7 +30,7 @@ def _compute_days(start: Optional[date], end: Optional[date]) -> Optional[int]:
     return (end - start).days + 1
 
 
-@dataclass
+@dataclass(slots=True)
 class ExperienceRecord:
     """Represents a single experience entry extracted from a document."""
 
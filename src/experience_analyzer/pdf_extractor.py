@@ -1,11 +1,21 @@
 """Utilities for extracting text from PDF files."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
 
+import hashlib
+import json
 import logging
+import os
 
 try:
     import fitz  # type: ignore
@@ -22,11 +32,19 @@ except ImportError:  # pragma: no cover - optional dependency
     pytesseract = None  # type: ignore
     Image = None  # type: ignore
 
-import io
 import shutil
 
 logger = logging.getLogger(__name__)
 
+# 200 dpi is enough for typed certificates and renders less than half the pixels of 300.
+OCR_DPI = 200
+OCR_LANGUAGES = "spa+eng"
+# Extraction results are cached here, keyed by the SHA-256 of the PDF and the OCR flag.
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "experience_analyzer"
+# Bump whenever extraction output changes in a way the OCR settings in the cache key
+# do not capture (page rendering, text post-processing, ...).
+CACHE_VERSION = 1
+
 
 @dataclass
 class ExtractionResult:
@@ -36,6 +54,34 @@ class ExtractionResult:
     method: str
 
 
+def _cache_path(pdf_path: Path, enable_ocr: bool) -> Path:
+    with pdf_path.open("rb") as handle:
+        digest = hashlib.file_digest(handle, "sha256").hexdigest()
+    settings = f"v{CACHE_VERSION}-ocr{int(enable_ocr)}-{OCR_DPI}dpi-{OCR_LANGUAGES}"
+    return CACHE_DIR / f"{digest}-{settings}.json"
+
+
+def _load_cached(cache_path: Path) -> Optional[ExtractionResult]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        return ExtractionResult(text=data["text"], method=data["method"])
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.debug("Ignoring unreadable cache entry %s: %s", cache_path, exc)
+        return None
+
+
+def _store_cached(cache_path: Path, result: ExtractionResult) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(asdict(result), ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(cache_path)
+    except OSError as exc:
+        logger.debug("Could not write cache entry %s: %s", cache_path, exc)
+
+
 def _page_text(page: "fitz.Page") -> str:
     return page.get_text("text") or ""
 
@@ -46,6 +92,39 @@ def _needs_ocr(text: str) -> bool:
     return len(cleaned) < 30
 
 
+def _render_page(page: "fitz.Page") -> Tuple[Tuple[int, int], bytes]:
+    # Tesseract works on grayscale anyway: one byte per pixel and no PNG round trip.
+    pixmap = page.get_pixmap(dpi=OCR_DPI, colorspace=fitz.csGRAY, alpha=False)
+    return (pixmap.width, pixmap.height), pixmap.samples
+
+
+def _ocr_image(index: int, rendered: Tuple[Tuple[int, int], bytes]) -> str:
+    size, samples = rendered
+    with Image.frombytes("L", size, samples) as image:
+        text = pytesseract.image_to_string(image, lang=OCR_LANGUAGES)
+    logger.debug("OCR extracted %d characters from page %d", len(text), index)
+    return text
+
+
+@contextmanager
+def _tesseract_thread_limit(enabled: bool) -> Iterator[None]:
+    """Limit each tesseract subprocess to one OpenMP thread while *enabled*.
+
+    Tesseract otherwise starts its own OpenMP pool per process, which oversubscribes
+    the CPU when several run side by side. The environment is restored on exit and a
+    limit already set by the user is left untouched.
+    """
+
+    if not enabled or "OMP_THREAD_LIMIT" in os.environ:
+        yield
+        return
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    try:
+        yield
+    finally:
+        os.environ.pop("OMP_THREAD_LIMIT", None)
+
+
 def _perform_ocr(pages: List["fitz.Page"]) -> str:
     if pytesseract is None or Image is None:
         logger.warning(
@@ -59,33 +138,55 @@ def _perform_ocr(pages: List["fitz.Page"]) -> str:
         )
         return ""
 
-    ocr_text: List[str] = []
-    for index, page in enumerate(pages):
-        pix = page.get_pixmap(dpi=300)
-        image_bytes = pix.tobytes(output="png")
-        with Image.open(io.BytesIO(image_bytes)) as image:
-            text = pytesseract.image_to_string(image, lang="spa+eng")
-            logger.debug("OCR extracted %d characters from page %d", len(text), index)
-            ocr_text.append(text)
+    workers = max(1, min(os.cpu_count() or 1, len(pages)))
+
+    # Pages are rendered on this thread because PyMuPDF objects are not thread-safe;
+    # each tesseract call runs in its own subprocess, so those can overlap. A page is
+    # only rendered once a worker is free, so at most `workers` raw page buffers are
+    # held in memory at a time.
+    ocr_text: List[str] = [""] * len(pages)
+    with _tesseract_thread_limit(workers > 1), ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight: Dict[Future[str], int] = {}
+        for index, page in enumerate(pages):
+            if len(in_flight) >= workers:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    ocr_text[in_flight.pop(future)] = future.result()
+            in_flight[executor.submit(_ocr_image, index, _render_page(page))] = index
+        for future, index in in_flight.items():
+            ocr_text[index] = future.result()
     return "\n".join(ocr_text)
 
 
-def extract_text_from_pdf(path: Path, *, enable_ocr: bool = True) -> ExtractionResult:
+def extract_text_from_pdf(
+    path: Path, *, enable_ocr: bool = True, use_cache: bool = False
+) -> ExtractionResult:
     """Extract text from *path*.
 
     The function first attempts to use the text layer available in the PDF. When the
     result appears to be empty it optionally falls back to OCR using pytesseract.
+    With *use_cache* the result is stored under ``CACHE_DIR`` and reused for files
+    with identical contents. The cache holds the full extracted text in plain JSON,
+    so it is off by default.
     """
 
     pdf_path = Path(path)
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
+    cache_path = _cache_path(pdf_path, enable_ocr) if use_cache else None
+    if cache_path is not None:
+        cached = _load_cached(cache_path)
+        if cached is not None:
+            logger.debug("Using cached extraction for %s", pdf_path.name)
+            return cached
+
     doc = fitz.open(pdf_path)
     try:
         text_segments = [_page_text(page) for page in doc]
         joined_text = "\n".join(text_segments)
         method = "text"
+        ocr_failed = False
 
         if enable_ocr and _needs_ocr(joined_text):
             logger.info("Text layer is scarce; attempting OCR for %s", pdf_path.name)
@@ -93,6 +194,14 @@ def extract_text_from_pdf(path: Path, *, enable_ocr: bool = True) -> ExtractionR
             if ocr_text.strip():
                 joined_text = ocr_text
                 method = "ocr"
-        return ExtractionResult(text=joined_text, method=method)
+            else:
+                ocr_failed = True
     finally:
         doc.close()
+
+    result = ExtractionResult(text=joined_text, method=method)
+    # A failed OCR attempt (e.g. tesseract not installed yet) is not cached so it is
+    # retried on the next run.
+    if cache_path is not None and not ocr_failed:
+        _store_cached(cache_path, result)
+    return result
@@ -18,12 +18,11 @@ def _format_days(days: int | None) -> str:
 
 
 def _compute_widths(rows: List[List[str]]) -> List[int]:
-    return [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return [max(map(len, column)) for column in zip(*rows)]
 
 
-def _format_row(row: List[str], widths: List[int]) -> str:
-    cells = [f"{cell:<{widths[idx]}}" for idx, cell in enumerate(row)]
-    return "| " + " | ".join(cells) + " |"
+def _row_template(widths: List[int]) -> str:
+    return "| " + " | ".join(f"{{:<{width}}}" for width in widths) + " |"
 
 
 def build_table(comparisons: Iterable[ComparisonResult]) -> str:
@@ -69,7 +68,6 @@ def build_table(comparisons: Iterable[ComparisonResult]) -> str:
 
     table_data = [headers] + rows
     widths = _compute_widths(table_data)
-    header_line = _format_row(headers, widths)
-    separator = "| " + " | ".join("-" * widths[idx] for idx in range(len(headers))) + " |"
-    body_lines = [_format_row(row, widths) for row in rows]
-    return "\n".join([header_line, separator, *body_lines])
+    template = _row_template(widths)
+    separator = template.format(*("-" * width for width in widths))
+    return "\n".join([template.format(*headers), separator, *(template.format(*row) for row in rows)])
@@ -3,10 +3,11 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from datetime import date, datetime
-from typing import Iterable, List, Optional, Sequence
+from datetime import date
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Match, Optional, Tuple
 
-from .models import ExperienceRecord
+from .models import ExperienceRecord, _compute_days, _compute_effective_end
 
 MONTHS = {
     "enero": 1,
@@ -24,16 +25,25 @@ MONTHS = {
     "diciembre": 12,
 }
 
+# Each alternative is a named group so a match tells which format it is and carries
+# the date fields, without a second parsing pass.
 DATE_PATTERN = re.compile(
     r"""
-    (?P<date>
-        \d{1,2}[/-]\d{1,2}[/-]\d{2,4}
-        |
-        \d{4}-\d{2}-\d{2}
-        |
-        \d{1,2}\s+(?:de\s+|d[ií]as\s+del\s+mes\s+de\s+)[a-zA-Záéíóúñ]+\s+de\s+\d{4}
-        |
-        [a-zA-Záéíóúñ]+\s+\d{1,2},\s*\d{4}
+    (?P<dmy>
+        (?P<dmy_day>\d{1,2})(?P<dmy_sep>[/-])(?P<dmy_month>\d{1,2})(?P=dmy_sep)(?P<dmy_year>\d{2,4})
+    )
+    |
+    (?P<iso>
+        (?P<iso_year>\d{4})-(?P<iso_month>\d{2})-(?P<iso_day>\d{2})
+    )
+    |
+    (?P<spanish_de>
+        (?P<de_day>\d{1,2})\s+(?:de\s+|d[ií]as\s+del\s+mes\s+de\s+)
+        (?P<de_month>[a-zA-Záéíóúñ]+)\s+de\s+(?P<de_year>\d{4})
+    )
+    |
+    (?P<spanish_comma>
+        (?P<comma_month>[a-zA-Záéíóúñ]+)\s+(?P<comma_day>\d{1,2}),\s*(?P<comma_year>\d{4})
     )
     """,
     re.VERBOSE | re.IGNORECASE,
@@ -53,6 +63,12 @@ KEYWORD_GROUPS = {
     "issue": ["expedido", "expide", "emitido", "fecha de expedición"],
 }
 
+# One alternation per keyword group so a context window is scanned once per group.
+KEYWORD_PATTERNS = {
+    role: re.compile("|".join(re.escape(keyword.lower()) for keyword in keywords))
+    for role, keywords in KEYWORD_GROUPS.items()
+}
+
 EMPLOYER_HINTS = [
     "empresa",
     "entidad",
@@ -68,46 +84,66 @@ EMPLOYER_HINTS = [
 ]
 
 
-def _parse_numeric_date(text: str) -> Optional[date]:
-    for fmt in ("%d/%m/%Y", "%d-%m-%Y", "%d/%m/%y", "%d-%m-%y", "%Y-%m-%d"):
-        try:
-            dt = datetime.strptime(text, fmt)
-            year = dt.year
-            if year < 100:
-                year += 2000 if year < 50 else 1900
-            return date(year, dt.month, dt.day)
-        except ValueError:
-            continue
-    return None
+def _build_date(year: int, month: Optional[int], day: int) -> Optional[date]:
+    if month is None:
+        return None
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _parse_dmy(match: Match[str]) -> Optional[date]:
+    year_text = match.group("dmy_year")
+    if len(year_text) == 3:
+        return None
+    year = int(year_text)
+    if len(year_text) == 2:
+        year += 2000 if year < 69 else 1900
+    return _build_date(year, int(match.group("dmy_month")), int(match.group("dmy_day")))
 
 
-def _parse_spanish_date(text: str) -> Optional[date]:
-    match = re.match(
-        r"(?P<day>\d{1,2})\s+(?:de\s+|d[ií]as\s+del\s+mes\s+de\s+)(?P<month>[a-záéíóúñ]+)\s+de\s+(?P<year>\d{4})",
-        text,
-        flags=re.IGNORECASE,
+def _parse_iso(match: Match[str]) -> Optional[date]:
+    return _build_date(
+        int(match.group("iso_year")), int(match.group("iso_month")), int(match.group("iso_day"))
     )
-    if match:
-        month_name = match.group("month").lower()
-        month = MONTHS.get(month_name)
-        if month:
-            return date(int(match.group("year")), month, int(match.group("day")))
-    match = re.match(
-        r"(?P<month>[a-záéíóúñ]+)\s+(?P<day>\d{1,2}),\s*(?P<year>\d{4})",
-        text,
-        flags=re.IGNORECASE,
+
+
+def _parse_spanish_de(match: Match[str]) -> Optional[date]:
+    return _build_date(
+        int(match.group("de_year")),
+        MONTHS.get(match.group("de_month").lower()),
+        int(match.group("de_day")),
     )
-    if match:
-        month_name = match.group("month").lower()
-        month = MONTHS.get(month_name)
-        if month:
-            return date(int(match.group("year")), month, int(match.group("day")))
-    return None
 
 
+def _parse_spanish_comma(match: Match[str]) -> Optional[date]:
+    return _build_date(
+        int(match.group("comma_year")),
+        MONTHS.get(match.group("comma_month").lower()),
+        int(match.group("comma_day")),
+    )
+
+
+# Keyed by the DATE_PATTERN alternative that matched (``match.lastgroup``).
+DATE_PARSERS: Dict[str, Callable[[Match[str]], Optional[date]]] = {
+    "dmy": _parse_dmy,
+    "iso": _parse_iso,
+    "spanish_de": _parse_spanish_de,
+    "spanish_comma": _parse_spanish_comma,
+}
+
+
+def _date_from_match(match: Match[str]) -> Optional[date]:
+    return DATE_PARSERS[match.lastgroup](match)
+
+
+@lru_cache(maxsize=4096)
 def _parse_date(text: str) -> Optional[date]:
-    cleaned = text.strip()
-    return _parse_numeric_date(cleaned) or _parse_spanish_date(cleaned)
+    match = DATE_PATTERN.fullmatch(text.strip())
+    if match is None:
+        return None
+    return _date_from_match(match)
 
 
 @dataclass
@@ -136,35 +172,36 @@ def split_into_sections(text: str) -> List[ParsedSection]:
     return sections
 
 
-def _find_first_matching_date(
+def _find_all_dates_by_role(
     section_text: str,
-    keywords: Sequence[str],
-    *,
-    position: str = "before",
-) -> Optional[date]:
+) -> Tuple[Optional[date], Optional[date], Optional[date]]:
+    """Return the ``(start, end, issue)`` dates of a section in a single pass.
+
+    Each role takes the first parseable date preceded by one of its keywords. When no
+    date is tagged as the issue date, the last date of the section is used instead.
+    """
+
     lowered = section_text.lower()
-    matches = list(DATE_PATTERN.finditer(section_text))
-    for match in matches:
+    found: dict[str, Optional[date]] = dict.fromkeys(KEYWORD_PATTERNS)
+    last_match = None
+    for match in DATE_PATTERN.finditer(section_text):
+        last_match = match
         span_start = match.start()
-        span_end = match.end()
-        before = lowered[max(span_start - 80, 0):span_start]
-        after = lowered[span_end:min(span_end + 80, len(section_text))]
-        before_match = position in ("before", "any") and any(keyword in before for keyword in keywords)
-        after_match = position in ("after", "any") and any(keyword in after for keyword in keywords)
-        if before_match or after_match:
-            parsed = _parse_date(match.group("date"))
-            if parsed:
-                return parsed
-    return None
-
+        window_start = max(span_start - 80, 0)
+        parsed: Optional[date] = None
+        # Parsed through the memoized _parse_date: the same date strings recur across
+        # sections and documents, and a miss only re-matches the short date text.
+        for role, keywords in KEYWORD_PATTERNS.items():
+            if found[role] is None and keywords.search(lowered, window_start, span_start):
+                parsed = parsed or _parse_date(match.group())
+                found[role] = parsed
+        if all(value is not None for value in found.values()):
+            break
 
-def _extract_issue_date(section: ParsedSection) -> Optional[date]:
-    section_text = section.text()
-    date_candidates = list(DATE_PATTERN.finditer(section_text))
-    if not date_candidates:
-        return None
-    last_candidate = date_candidates[-1].group("date")
-    return _parse_date(last_candidate)
+    issue_date = found["issue"]
+    if issue_date is None and last_match is not None:
+        issue_date = _parse_date(last_match.group())
+    return found["start"], found["end"], issue_date
 
 
 def _extract_employer(section: ParsedSection) -> Optional[str]:
@@ -192,12 +229,7 @@ def parse_experiences_from_text(text: str, source: str) -> List[ExperienceRecord
         sections = [ParsedSection(lines=[text])]
 
     for section in sections:
-        section_text = section.text()
-        start_date = _find_first_matching_date(section_text, KEYWORD_GROUPS["start"], position="before")
-        end_date = _find_first_matching_date(section_text, KEYWORD_GROUPS["end"], position="before")
-        issue_date = _find_first_matching_date(section_text, KEYWORD_GROUPS["issue"], position="before")
-        if issue_date is None:
-            issue_date = _extract_issue_date(section)
+        start_date, end_date, issue_date = _find_all_dates_by_role(section.text())
         if not any([start_date, end_date, issue_date]):
             continue
         employer = _extract_employer(section)
@@ -244,9 +276,17 @@ def merge_overlapping_records(records: Iterable[ExperienceRecord]) -> List[Exper
                         or next_item.effective_end_date > current.effective_end_date
                     )
                 ):
-                    current.end_date = next_item.end_date or current.end_date
-                    current.issue_date = next_item.issue_date or current.issue_date
-                    current.__post_init__()
+                    end_date = next_item.end_date or current.end_date
+                    issue_date = next_item.issue_date or current.issue_date
+                    if end_date != current.end_date or issue_date != current.issue_date:
+                        current.end_date = end_date
+                        current.issue_date = issue_date
+                        current.effective_end_date = _compute_effective_end(
+                            current.start_date, end_date, issue_date
+                        )
+                        current.experience_days = _compute_days(
+                            current.start_date, current.effective_end_date
+                        )
             else:
                 merged.append(current)
                 current = next_item
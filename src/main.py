@@ -4,15 +4,21 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+from datetime import date
 from pathlib import Path
 from typing import List
 
 from experience_analyzer.comparer import compare_certificates_with_cv
 from experience_analyzer.models import ExperienceRecord
-from experience_analyzer.pdf_extractor import extract_text_from_pdf
+from experience_analyzer.pdf_extractor import CACHE_DIR, extract_text_from_pdf
 from experience_analyzer.report import build_table
 from experience_analyzer.text_parser import parse_experiences_from_text
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency, fall back to json
+    orjson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,11 +29,13 @@ def _configure_logging(verbose: bool) -> None:
     )
 
 
-def _load_experiences(paths: List[Path], source_label: str) -> List[ExperienceRecord]:
+def _load_experiences(
+    paths: List[Path], source_label: str, *, use_cache: bool = False
+) -> List[ExperienceRecord]:
     experiences: List[ExperienceRecord] = []
     for path in paths:
         logger.info("Leyendo %s", path)
-        extraction = extract_text_from_pdf(path)
+        extraction = extract_text_from_pdf(path, use_cache=use_cache)
         logger.info("Texto extraído mediante %s", extraction.method)
         parsed = parse_experiences_from_text(extraction.text, source=f"{source_label}: {path.name}")
         if not parsed:
@@ -36,6 +44,14 @@ def _load_experiences(paths: List[Path], source_label: str) -> List[ExperienceRe
     return experiences
 
 
+def _dump_json(payload: object) -> bytes:
+    """Serialize *payload* as indented UTF-8 JSON, writing dates as ISO strings."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, ensure_ascii=False, indent=2, default=date.isoformat).encode("utf-8")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Analiza certificados laborales y hoja de vida")
     parser.add_argument("certificates", nargs="+", type=Path, help="Rutas de los PDF de certificaciones")
@@ -45,13 +61,21 @@ def main() -> None:
         type=Path,
         help="Ruta de archivo JSON opcional para guardar los resultados estructurados",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "Guarda y reutiliza el texto extraído de cada PDF en "
+            f"{CACHE_DIR} (texto completo sin cifrar; bórrelo cuando ya no lo necesite)"
+        ),
+    )
     parser.add_argument("--verbose", action="store_true", help="Muestra información detallada")
 
     args = parser.parse_args()
     _configure_logging(args.verbose)
 
-    certificate_records = _load_experiences(args.certificates, "Certificado")
-    cv_records = _load_experiences([args.cv], "Hoja de vida")
+    certificate_records = _load_experiences(args.certificates, "Certificado", use_cache=args.cache)
+    cv_records = _load_experiences([args.cv], "Hoja de vida", use_cache=args.cache)
 
     comparisons = compare_certificates_with_cv(certificate_records, cv_records)
     table = build_table(comparisons)
@@ -62,32 +86,20 @@ def main() -> None:
             {
                 "fuente": comparison.certificate.source,
                 "entidad": comparison.certificate.employer,
-                "ingreso_certificado": comparison.certificate.start_date.isoformat()
-                if comparison.certificate.start_date
-                else None,
-                "retiro_certificado": comparison.certificate.end_date.isoformat()
-                if comparison.certificate.end_date
-                else None,
-                "fecha_expedicion": comparison.certificate.issue_date.isoformat()
-                if comparison.certificate.issue_date
-                else None,
-                "fin_contabilizado": comparison.certificate.effective_end_date.isoformat()
-                if comparison.certificate.effective_end_date
-                else None,
+                "ingreso_certificado": comparison.certificate.start_date,
+                "retiro_certificado": comparison.certificate.end_date,
+                "fecha_expedicion": comparison.certificate.issue_date,
+                "fin_contabilizado": comparison.certificate.effective_end_date,
                 "dias_experiencia": comparison.certificate.experience_days,
                 "coincide_hv": comparison.start_date_match and comparison.cv_entry is not None,
                 "entidad_hv": comparison.cv_entry.employer if comparison.cv_entry else None,
-                "ingreso_hv": comparison.cv_entry.start_date.isoformat()
-                if comparison.cv_entry and comparison.cv_entry.start_date
-                else None,
-                "retiro_hv": comparison.cv_entry.end_date.isoformat()
-                if comparison.cv_entry and comparison.cv_entry.end_date
-                else None,
+                "ingreso_hv": comparison.cv_entry.start_date if comparison.cv_entry else None,
+                "retiro_hv": comparison.cv_entry.end_date if comparison.cv_entry else None,
                 "detalle": comparison.details,
             }
             for comparison in comparisons
         ]
-        args.output_json.write_text(json.dumps(payload, ensure_ascii=False, indent=2))
+        args.output_json.write_bytes(_dump_json(payload))
         logger.info("Resultados guardados en %s", args.output_json)
 
 
@@ -1,5 +1,10 @@
 from datetime import date
+from difflib import SequenceMatcher
 
+import numpy as np
+import pytest
+
+from experience_analyzer import comparer
 from experience_analyzer.comparer import compare_certificates_with_cv
 from experience_analyzer.models import ExperienceRecord
 
@@ -24,3 +29,106 @@ def test_compare_matches_by_employer_and_start_date():
     assert match.cv_entry is not None
     assert match.start_date_match is True
     assert "Coincidencia" in match.details
+
+
+def test_compare_does_not_assign_same_cv_entry_twice():
+    first = _record("Certificado: 1.pdf", "Empresa ABC", date(2020, 1, 1), date(2020, 12, 31))
+    second = _record("Certificado: 2.pdf", "Empresa ABC Ltda", date(2021, 1, 1), date(2021, 12, 31))
+    cv_abc = _record("Hoja de vida: hv.pdf", "Empresa ABC", date(2021, 1, 1), date(2021, 12, 31))
+    cv_other = _record("Hoja de vida: hv.pdf", "Empresa ABC", date(2020, 1, 3), date(2020, 12, 31))
+
+    comparisons = compare_certificates_with_cv([first, second], [cv_abc, cv_other])
+    assert comparisons[0].cv_entry is cv_other
+    assert comparisons[1].cv_entry is cv_abc
+    assert all(comparison.start_date_match for comparison in comparisons)
+    assert len(comparisons) == 2
+
+
+def test_compare_reports_unmatched_entries():
+    certificate = _record("Certificado: 1.pdf", "Empresa ABC", date(2020, 1, 1), date(2020, 12, 31))
+    cv_entry = _record("Hoja de vida: hv.pdf", "Colegio Nacional", date(2015, 3, 1), date(2016, 3, 1))
+
+    comparisons = compare_certificates_with_cv([certificate], [cv_entry])
+    assert [comparison.cv_entry for comparison in comparisons] == [None, cv_entry]
+    assert comparisons[1].details == "Registro presente solo en la hoja de vida"
+
+
+def test_compare_matches_long_employer_line_on_start_date():
+    certificate = _record(
+        "Certificado: 1.pdf",
+        "La XYZ S.A. certifica que se vinculó desde el 3 de enero de 2020",
+        date(2020, 1, 3),
+        date(2021, 7, 15),
+    )
+    cv_entry = _record("Hoja de vida: hv.pdf", "XYZ S.A.", date(2020, 1, 3), date(2021, 7, 15))
+
+    comparisons = compare_certificates_with_cv([certificate], [cv_entry])
+    assert comparisons[0].cv_entry is cv_entry
+    assert comparisons[0].start_date_match is True
+
+
+@pytest.fixture
+def difflib_only(monkeypatch):
+    monkeypatch.setattr(comparer, "fuzz", None)
+    monkeypatch.setattr(comparer, "process", None)
+
+
+def test_difflib_fallback_matches_long_employer_line(difflib_only):
+    certificate = _record(
+        "Certificado: 1.pdf",
+        "La XYZ S.A. certifica que se vinculó desde el 3 de enero de 2020",
+        date(2020, 1, 3),
+        date(2021, 7, 15),
+    )
+    cv_entries = [
+        _record("Hoja de vida: hv.pdf", "La Previsora S.A.", date(2015, 3, 1), date(2016, 3, 1)),
+        _record("Hoja de vida: hv.pdf", "XYZ S.A.", date(2020, 1, 3), date(2021, 7, 15)),
+    ]
+
+    comparisons = compare_certificates_with_cv([certificate], cv_entries)
+    assert comparisons[0].cv_entry is cv_entries[1]
+    assert comparisons[0].start_date_match is True
+
+
+def test_difflib_gate_skips_pairs_that_cannot_clear_threshold(difflib_only, monkeypatch):
+    ratio_calls = []
+
+    class CountingMatcher(SequenceMatcher):
+        def ratio(self):
+            ratio_calls.append((self.a, self.b))
+            return super().ratio()
+
+    monkeypatch.setattr(comparer, "SequenceMatcher", CountingMatcher)
+    far = _record("Certificado: 1.pdf", "ABC", date(2010, 1, 1), date(2010, 12, 31))
+    same_day = _record("Certificado: 2.pdf", "XYZ", date(2020, 1, 3), date(2020, 12, 31))
+    cv_entry = _record("Hoja de vida: hv.pdf", "Corporación Universitaria XYZ", date(2020, 1, 3), None)
+
+    comparisons = compare_certificates_with_cv([far, same_day], [cv_entry])
+    # The far-off certificate's length bound cannot clear the threshold: no ratio() call.
+    assert ratio_calls == [("xyz", "corporacion universitaria xyz")]
+    assert comparisons[0].cv_entry is None
+    assert comparisons[1].cv_entry is cv_entry
+
+
+def test_difflib_fallback_disables_autojunk(difflib_only):
+    required = np.zeros((1, 1))
+    similarity = comparer._similarity_matrix(["instituto " * 25], ["insttuto " * 25], required)
+    # With autojunk the frequent characters of a 200+ character name are ignored and
+    # the ratio collapses to about 0.02.
+    assert similarity[0, 0] > 0.9
+
+
+def test_difflib_matrix_matches_fresh_matcher_per_pair(difflib_only):
+    certificate_names = ["empresa abc", "colegio nacional", "", "xyz sa"]
+    cv_names = ["empresa abc ltda", "xyz", "colegio nacional de bogota"]
+    required = np.full((len(certificate_names), len(cv_names)), -1.0)
+
+    similarity = comparer._similarity_matrix(certificate_names, cv_names, required)
+    for row, certificate_name in enumerate(certificate_names):
+        for col, cv_name in enumerate(cv_names):
+            expected = (
+                SequenceMatcher(None, certificate_name, cv_name, autojunk=False).ratio()
+                if certificate_name
+                else 0.0
+            )
+            assert similarity[row, col] == pytest.approx(expected, abs=1e-6)
@@ -0,0 +1,117 @@
+import random
+import threading
+import time
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from experience_analyzer import pdf_extractor  # noqa: E402
+
+
+def _write_pdf(path, text):
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), text)
+    doc.save(path)
+    doc.close()
+
+
+def test_extract_text_reuses_cached_result(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_extractor, "CACHE_DIR", tmp_path / "cache")
+    pdf_path = tmp_path / "certificado.pdf"
+    _write_pdf(pdf_path, "La empresa XYZ S.A. certifica que se vinculo desde el 03/01/2020")
+
+    first = pdf_extractor.extract_text_from_pdf(pdf_path, use_cache=True)
+    assert first.method == "text"
+    assert "XYZ S.A." in first.text
+
+    def _fail_open(*_args, **_kwargs):
+        raise AssertionError("PDF should not be reopened on a cache hit")
+
+    monkeypatch.setattr(pdf_extractor.fitz, "open", _fail_open)
+    assert pdf_extractor.extract_text_from_pdf(pdf_path, use_cache=True) == first
+    with pytest.raises(AssertionError):
+        pdf_extractor.extract_text_from_pdf(pdf_path)
+
+
+def test_extract_text_does_not_cache_by_default(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_extractor, "CACHE_DIR", tmp_path / "cache")
+    pdf_path = tmp_path / "certificado.pdf"
+    _write_pdf(pdf_path, "La empresa XYZ S.A. certifica que se vinculo desde el 03/01/2020")
+
+    pdf_extractor.extract_text_from_pdf(pdf_path)
+    assert not (tmp_path / "cache").exists()
+
+
+def test_extract_text_cache_depends_on_ocr_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_extractor, "CACHE_DIR", tmp_path / "cache")
+    pdf_path = tmp_path / "certificado.pdf"
+    _write_pdf(pdf_path, "La empresa XYZ S.A. certifica que se vinculo desde el 03/01/2020")
+
+    default_path = pdf_extractor._cache_path(pdf_path, True)
+    assert pdf_extractor._cache_path(pdf_path, False) != default_path
+    monkeypatch.setattr(pdf_extractor, "OCR_DPI", 300)
+    assert pdf_extractor._cache_path(pdf_path, True) != default_path
+    monkeypatch.setattr(pdf_extractor, "CACHE_VERSION", pdf_extractor.CACHE_VERSION + 1)
+    assert pdf_extractor._cache_path(pdf_path, True) != default_path
+
+
+def test_perform_ocr_limits_tesseract_threads_only_while_running(monkeypatch):
+    pytest.importorskip("pytesseract")
+    pytest.importorskip("PIL")
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    monkeypatch.setattr(pdf_extractor.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(pdf_extractor.shutil, "which", lambda _name: "/usr/bin/tesseract")
+    seen_limits = []
+
+    def _image_to_string(_image, lang):
+        seen_limits.append(pdf_extractor.os.environ.get("OMP_THREAD_LIMIT"))
+        return ""
+
+    monkeypatch.setattr(pdf_extractor.pytesseract, "image_to_string", _image_to_string)
+    doc = fitz.open()
+    for _ in range(3):
+        doc.new_page(width=72, height=72)
+
+    pdf_extractor._perform_ocr(list(doc))
+    assert seen_limits == ["1", "1", "1"]
+    assert "OMP_THREAD_LIMIT" not in pdf_extractor.os.environ
+
+
+def test_perform_ocr_keeps_page_order_with_out_of_order_results(monkeypatch):
+    pytest.importorskip("pytesseract")
+    pytest.importorskip("PIL")
+    monkeypatch.setattr(pdf_extractor.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(pdf_extractor.shutil, "which", lambda _name: "/usr/bin/tesseract")
+    delays = random.Random(0)
+    lock = threading.Lock()
+    counts = {"rendered": 0, "finished": 0, "max_outstanding": 0}
+    render_page = pdf_extractor._render_page
+
+    def _counting_render_page(page):
+        rendered = render_page(page)
+        with lock:
+            counts["rendered"] += 1
+            outstanding = counts["rendered"] - counts["finished"]
+            counts["max_outstanding"] = max(counts["max_outstanding"], outstanding)
+        return rendered
+
+    def _image_to_string(image, lang):
+        # Page i is 36 * (i + 1) points wide, i.e. 100 * (i + 1) pixels at OCR_DPI.
+        assert image.mode == "L"
+        page_number = image.width // 100
+        time.sleep(delays.uniform(0, 0.02))
+        with lock:
+            counts["finished"] += 1
+        return f"pagina {page_number}"
+
+    monkeypatch.setattr(pdf_extractor, "_render_page", _counting_render_page)
+    monkeypatch.setattr(pdf_extractor.pytesseract, "image_to_string", _image_to_string)
+    doc = fitz.open()
+    for index in range(10):
+        doc.new_page(width=36 * (index + 1), height=36)
+
+    text = pdf_extractor._perform_ocr(list(doc))
+    assert text.splitlines() == [f"pagina {number}" for number in range(1, 11)]
+    assert counts["max_outstanding"] <= 4
@@ -1,6 +1,13 @@
 from datetime import date
 
-from experience_analyzer.text_parser import parse_experiences_from_text
+import pytest
+
+from experience_analyzer.models import ExperienceRecord
+from experience_analyzer.text_parser import (
+    _parse_date,
+    merge_overlapping_records,
+    parse_experiences_from_text,
+)
 
 
 CERT_TEXT = """
@@ -35,3 +42,39 @@ def test_parse_cv_text_extracts_information():
     assert record.start_date == date(2020, 1, 3)
     assert record.end_date == date(2021, 7, 15)
     assert record.experience_days == 560
+
+
+def test_parse_uses_last_date_as_issue_date_when_not_tagged():
+    records = parse_experiences_from_text(CV_TEXT, source="Hoja de vida: hv.pdf")
+    assert records[0].issue_date == date(2021, 7, 15)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("03/01/2020", date(2020, 1, 3)),
+        ("3-1-20", date(2020, 1, 3)),
+        ("5/5/69", date(1969, 5, 5)),
+        ("2020-01-15", date(2020, 1, 15)),
+        ("20 días del mes de Julio de 2021", date(2021, 7, 20)),
+        ("marzo 31, 2019", date(2019, 3, 31)),
+        ("31/02/2020", None),
+        ("3/01-2020", None),
+        ("15 de brumario de 2020", None),
+    ],
+)
+def test_parse_date_formats(text, expected):
+    assert _parse_date(text) == expected
+
+
+def test_merge_overlapping_records_extends_end_date():
+    first = ExperienceRecord("Certificado", "Empresa XYZ", date(2020, 1, 1), date(2020, 6, 30))
+    second = ExperienceRecord("Certificado", "empresa xyz ", date(2020, 5, 1), date(2020, 12, 31))
+    later = ExperienceRecord("Certificado", "Empresa XYZ", date(2022, 1, 1), date(2022, 1, 31))
+
+    merged = merge_overlapping_records([later, second, first])
+    assert [(rec.start_date, rec.effective_end_date) for rec in merged] == [
+        (date(2020, 1, 1), date(2020, 12, 31)),
+        (date(2022, 1, 1), date(2022, 1, 31)),
+    ]
+    assert merged[0].experience_days == 366